@@ -0,0 +1,207 @@
+"""
+Freezes the bulky test arrays into .npy files under tests/data.
+
+The unit tests load these with numpy.load(..., mmap_mode="r") so
+pytest collection does not re-parse large Python literals on every
+import. Re-run this script whenever the reference data change.
+"""
+import pathlib
+
+import numpy
+
+DATA_DIR = pathlib.Path(__file__).parent.parent / "tests" / "data"
+
+# Baseline (u, v, w) coordinates in [ntimes, nbaselines, 3]
+UVW = numpy.array(
+    [
+        [
+            [0.0, 0.0, 0.0],
+            [-397.89452612, 584.1169983, -153.35096251],
+            [-1357.78172302, 56.39427491, -30.15833161],
+            [-33.08582193, -422.93637971, 107.28705751],
+            [0.0, 0.0, 0.0],
+            [-959.8871969, -527.7227234, 123.1926309],
+        ],
+        [
+            [0.0, 0.0, 0.0],
+            [-397.67291131, 584.32154768, -153.14641314],
+            [-1357.76787287, 57.09247337, -29.46013315],
+            [-33.24812717, -422.9193245, 107.30411272],
+            [0.0, 0.0, 0.0],
+            [-960.09496157, -527.2290743, 123.68627999],
+        ],
+        [
+            [0.0, 0.0, 0.0],
+            [-397.45108619, 584.52598303, -152.94197778],
+            [-1357.75330468, 57.79066453, -28.76194199],
+            [-33.41041483, -422.90218584, 107.32125138],
+            [0.0, 0.0, 0.0],
+            [-960.30221849, -526.7353185, 124.18003579],
+        ],
+        [
+            [0.0, 0.0, 0.0],
+            [-397.22905088, 584.73030427, -152.73765654],
+            [-1357.73801843, 58.48884802, -28.0637585],
+            [-33.57268481, -422.88496373, 107.33847349],
+            [0.0, 0.0, 0.0],
+            [-960.50896755, -526.24145625, 124.67389804],
+        ],
+        [
+            [0.0, 0.0, 0.0],
+            [-397.0068055, 584.93451128, -152.53344954],
+            [-1357.72201414, 59.18702345, -27.36558307],
+            [-33.73493705, -422.86765818, 107.35577904],
+            [0.0, 0.0, 0.0],
+            [-960.71520865, -525.74748782, 125.16786647],
+        ],
+    ]
+)
+
+
+# x-parameter (antenna pointings) required for fitting
+X_PER_SCAN = numpy.array(
+    [
+        [
+            [7.25041746e-06, -9.99999151e-01],
+            [7.25041746e-06, -9.99999151e-01],
+            [7.25041746e-06, -9.99999151e-01],
+        ],
+        [
+            [1.57611535e-06, 3.33334665e-01],
+            [1.57611535e-06, 3.33334665e-01],
+            [1.57611535e-06, 3.33334665e-01],
+        ],
+        [
+            [4.01609741e-06, 1.00000129e00],
+            [4.01609741e-06, 1.00000129e00],
+            [4.01609741e-06, 1.00000129e00],
+        ],
+        [
+            [3.33337117e-01, 2.12096489e-06],
+            [3.33337117e-01, 2.12096489e-06],
+            [3.33337117e-01, 2.12096489e-06],
+        ],
+        [
+            [1.00000156e00, 1.12394609e-06],
+            [1.00000156e00, 1.12394609e-06],
+            [1.00000156e00, 1.12394609e-06],
+        ],
+    ]
+)
+
+# Requested pointings in azel (degrees)
+REQUESTED_POINTING_AZ = numpy.array(
+    [
+        [148.9414995, 148.94205178, 148.94271892],
+        [148.94172025, 148.94236573, 148.94355854],
+        [148.94101771, 148.94200575, 148.94254095],
+        [148.94171501, 148.94121957, 148.94304378],
+        [148.94140716, 148.94244255, 148.94256353],
+    ]
+)
+
+REQUESTED_POINTING_EL = numpy.array(
+    [
+        [33.39730196, 33.41221842, 34.12342723],
+        [33.3971681, 33.41170513, 34.12257392],
+        [34.06417534, 34.07836893, 34.79018015],
+        [34.06363578, 34.07853663, 34.78971391],
+        [34.73060623, 34.74537779, 35.45614139],
+    ]
+)
+
+# Actual pointings in azel (degrees)
+ACTUAL_POINTING_AZ = numpy.array(
+    [
+        [148.94151627, 148.94209042, 148.94269345],
+        [148.9416127, 148.94223792, 148.9435879],
+        [148.94151282, 148.94186983, 148.94285118],
+        [148.94127324, 148.94149587, 148.94311848],
+        [148.94128754, 148.94246971, 148.94286926],
+    ]
+)
+
+ACTUAL_POINTING_EL = numpy.array(
+    [
+        [34.39740428, 34.41229524, 35.12337574],
+        [34.39719755, 34.4118988, 35.12285761],
+        [34.39757858, 34.41206149, 35.12348981],
+        [34.39708119, 34.41189889, 35.12313388],
+        [34.39734882, 34.41193127, 35.12321936],
+    ]
+)
+
+# Source offset (difference between actual and requested pointings)
+# in degrees
+SOURCE_OFFSET_AZ = numpy.array(
+    [
+        [
+            -1.67656219e-05,
+            -3.86416795e-05,
+            2.54736615e-05,
+        ],
+        [
+            1.07554380e-04,
+            1.27813267e-04,
+            -2.93635031e-05,
+        ],
+        [
+            -4.95111837e-04,
+            1.35920940e-04,
+            -3.10228964e-04,
+        ],
+        [
+            4.41771802e-04,
+            -2.76304939e-04,
+            -7.46971279e-05,
+        ],
+        [
+            1.19623691e-04,
+            -2.71621773e-05,
+            -3.05732096e-04,
+        ],
+    ]
+)
+
+SOURCE_OFFSET_EL = numpy.array(
+    [
+        [
+            -1.00010232,
+            -1.00007682,
+            -0.99994851,
+        ],
+        [
+            -1.00002945,
+            -1.00019367,
+            -1.00028369,
+        ],
+        [
+            -0.33340324,
+            -0.33369256,
+            -0.33330966,
+        ],
+        [
+            -0.33344541,
+            -0.33336226,
+            -0.33341997,
+        ],
+        [0.33325741, 0.33344652, 0.33292203],
+    ]
+)
+
+
+def main():
+    """Write the frozen arrays"""
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    numpy.save(DATA_DIR / "uvw.npy", UVW)
+    numpy.save(DATA_DIR / "x_per_scan.npy", X_PER_SCAN)
+    numpy.save(DATA_DIR / "requested_pointing_az.npy", REQUESTED_POINTING_AZ)
+    numpy.save(DATA_DIR / "requested_pointing_el.npy", REQUESTED_POINTING_EL)
+    numpy.save(DATA_DIR / "actual_pointing_az.npy", ACTUAL_POINTING_AZ)
+    numpy.save(DATA_DIR / "actual_pointing_el.npy", ACTUAL_POINTING_EL)
+    numpy.save(DATA_DIR / "source_offset_az.npy", SOURCE_OFFSET_AZ)
+    numpy.save(DATA_DIR / "source_offset_el.npy", SOURCE_OFFSET_EL)
+
+
+if __name__ == "__main__":
+    main()
@@ -84,7 +84,11 @@ def interp_timestamps(origin_data, origin_times, new_times):
     direction_el = origin_data[:, :, 1]
     output = numpy.zeros((ntimes_new, origin_data.shape[1], 2))
 
-    times = numpy.array([origin_times, new_times]).T
+    # Write both time columns into one pre-sized buffer instead of
+    # stacking and transposing a temporary (2, ntimes) array
+    times = numpy.empty((ntimes_new, 2))
+    times[:, 0] = origin_times
+    times[:, 1] = new_times
     for i in range(origin_data.shape[1]):
         az_ant = direction_az[:, i]
         el_ant = direction_el[:, i]
@@ -150,16 +154,23 @@ def weighted_average(ants, fitted_beams):
     return pointing_offset
 
 
-def compute_gains(vis, num_chunks):
+def compute_gains(vis, num_chunks, out=None):
     """
     Solves for the antenna gains for the parallel hands only.
 
     :param vis: The observed Visibility object
     :param num_chunks: Number of frequency chunks (integer)
-
-    :return: GainTable containing solution
+    :param out: Optional pre-allocated sequence of length num_chunks
+        in which the solutions are stored in place. When not provided,
+        a new list is allocated for the solutions
+
+    :return: List (or the filled ``out`` buffer) of GainTables
+        containing the solutions. If the channels are not divisible
+        by num_chunks the solver falls back to a single chunk and
+        only a 1-element list is returned
     """
     freqs = vis.frequency.data
+    channels = None
     if num_chunks > 1:
         try:
             channels = numpy.arange(len(freqs)).reshape(num_chunks, -1)
@@ -168,69 +179,58 @@ def compute_gains(vis, num_chunks):
                 "Frequency channels not divisible by number of chunks. "
                 "Use num_chunks=1 instead."
             )
-            gt_list = [
-                solve_gaintable(
-                    vis=vis,
-                    modelvis=None,
-                    gain_table=None,
-                    phase_only=False,
-                    niter=200,
-                    tol=1e-06,
-                    crosspol=False,
-                    normalise_gains=None,
-                    jones_type="G",
-                    timeslice=None,
-                )
-            ]
-        else:
-            gt_list = []
-            for chan in channels:
-                start = chan[0]
-                end = chan[-1] + 1
-                new_vis = Visibility.constructor(
-                    frequency=freqs[start:end],
-                    channel_bandwidth=vis.channel_bandwidth.data[start:end],
-                    phasecentre=vis.phasecentre,
-                    baselines=vis["baselines"],
-                    configuration=vis.attrs["configuration"],
-                    uvw=vis["uvw"].data,
-                    time=vis["time"].data,
-                    vis=vis.vis.data[:, :, start:end, :],
-                    flags=vis.flags.data[:, :, start:end, :],
-                    weight=vis.weight.data[:, :, start:end, :],
-                    integration_time=vis["integration_time"].data,
-                    polarisation_frame=vis.visibility_acc.polarisation_frame,
-                    source=vis.attrs["source"],
-                    meta=vis.attrs["meta"],
-                )
-                gt_list.append(
-                    solve_gaintable(
-                        vis=new_vis,
-                        modelvis=None,
-                        gain_table=None,
-                        phase_only=False,
-                        niter=200,
-                        tol=1e-06,
-                        crosspol=False,
-                        normalise_gains=None,
-                        jones_type="G",
-                        timeslice=None,
-                    )
-                )
-    else:
-        gt_list = [
-            solve_gaintable(
-                vis=vis,
-                modelvis=None,
-                gain_table=None,
-                phase_only=False,
-                niter=200,
-                tol=1e-06,
-                crosspol=False,
-                normalise_gains=None,
-                jones_type="G",
-                timeslice=None,
-            )
-        ]
 
-    return gt_list
+    if channels is None:
+        if out is None:
+            out = [None]
+        out[0] = solve_gaintable(
+            vis=vis,
+            modelvis=None,
+            gain_table=None,
+            phase_only=False,
+            niter=200,
+            tol=1e-06,
+            crosspol=False,
+            normalise_gains=None,
+            jones_type="G",
+            timeslice=None,
+        )
+        # Only index 0 holds a solution on this path; never hand back
+        # stale entries from a larger caller-provided buffer
+        return out[:1]
+
+    if out is None:
+        out = [None] * num_chunks
+    for i, chan in enumerate(channels):
+        start = chan[0]
+        end = chan[-1] + 1
+        new_vis = Visibility.constructor(
+            frequency=freqs[start:end],
+            channel_bandwidth=vis.channel_bandwidth.data[start:end],
+            phasecentre=vis.phasecentre,
+            baselines=vis["baselines"],
+            configuration=vis.attrs["configuration"],
+            uvw=vis["uvw"].data,
+            time=vis["time"].data,
+            vis=vis.vis.data[:, :, start:end, :],
+            flags=vis.flags.data[:, :, start:end, :],
+            weight=vis.weight.data[:, :, start:end, :],
+            integration_time=vis["integration_time"].data,
+            polarisation_frame=vis.visibility_acc.polarisation_frame,
+            source=vis.attrs["source"],
+            meta=vis.attrs["meta"],
+        )
+        out[i] = solve_gaintable(
+            vis=new_vis,
+            modelvis=None,
+            gain_table=None,
+            phase_only=False,
+            niter=200,
+            tol=1e-06,
+            crosspol=False,
+            normalise_gains=None,
+            jones_type="G",
+            timeslice=None,
+        )
+
+    return out
@@ -13,8 +13,17 @@ import numpy
 from katpoint import lightspeed
 from scikits.fitting import GaussianFit, ScatterFit
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 log = logging.getLogger("ska-sdp-pointing-offset")
 
+# Gaussian function reaches half its peak value at sqrt(2 log 2)*sigma
+_SIGMA_TO_FWHM = 2.0 * numpy.sqrt(2.0 * numpy.log(2.0))
+_FWHM_TO_SIGMA = 1.0 / _SIGMA_TO_FWHM
+
 
 def _fwhm_to_sigma(fwhm):
     """
@@ -28,8 +37,7 @@ def _fwhm_to_sigma(fwhm):
     right of the peak where the Gaussian function attains half
     its maximum value
     """
-    # Gaussian function reaches half its peak value at sqrt(2 log 2)*sigma
-    return fwhm / 2.0 / numpy.sqrt(2.0 * numpy.log(2.0))
+    return fwhm * _FWHM_TO_SIGMA
 
 
 def _sigma_to_fwhm(sigma):
@@ -44,8 +52,14 @@ def _sigma_to_fwhm(sigma):
     is the width between the two points left and right of the peak
     where the Gaussian function attains half its maximum value
     """
-    # Gaussian function reaches half its peak value at sqrt(2 log 2)*sigma
-    return 2.0 * numpy.sqrt(2.0 * numpy.log(2.0)) * sigma
+    return _SIGMA_TO_FWHM * sigma
+
+
+if njit is not None:
+    # Compile the scalar conversion helpers once so repeated calls in
+    # the fitting loops avoid Python call overhead
+    _fwhm_to_sigma = njit(cache=True)(_fwhm_to_sigma)
+    _sigma_to_fwhm = njit(cache=True)(_sigma_to_fwhm)
 
 
 class BeamPatternFit(ScatterFit):
@@ -161,6 +175,12 @@ class SolveForOffsets:
         thresh_width,
     ):
         self.x_per_scan = x_per_scan
+        # Antenna-major contiguous copy of the pointing coordinates
+        # so each per-antenna fit reads a single (2, number of scans)
+        # block instead of a strided slice
+        self.x_per_antenna = numpy.ascontiguousarray(
+            numpy.transpose(x_per_scan, (1, 2, 0))
+        )
         self.y_per_scan = y_per_scan
         self.freqs = freqs
         self.beamwidth_factor = beamwidth_factor
@@ -201,7 +221,7 @@ class SolveForOffsets:
                 height=1.0,
             )
             fitted_beam.fit(
-                x=self.x_per_scan[:, i].T,
+                x=self.x_per_antenna[i],
                 y=self.y_per_scan[
                     i,
                 ],
@@ -236,7 +256,7 @@ class SolveForOffsets:
                 height=1.0,
             )
             fitted_beam.fit(
-                x=self.x_per_scan[:, i].T,
+                x=self.x_per_antenna[i],
                 y=self.y_per_scan[
                     i,
                 ],
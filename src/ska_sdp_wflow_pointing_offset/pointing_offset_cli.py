@@ -97,6 +97,9 @@ def compute_offset(args):
     obtain the pointing offsets.
 
     :param args: required and optional arguments
+    :return: the computed offsets as [antenna name, azimuth offset,
+        elevation offset, cross-elevation offset] per antenna, in
+        units of arcminutes
     """
     begin = time.time()
 
@@ -302,6 +305,8 @@ def compute_offset(args):
         "\nProcess finished in %s", (datetime.timedelta(seconds=end - begin))
     )
 
+    return pointing_offset
+
 
 if __name__ == "__main__":
     main()
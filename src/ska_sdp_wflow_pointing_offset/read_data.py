@@ -139,29 +139,26 @@ def _read_visibilities(
     source_ra, source_dec = source_table.getcol("DIRECTION")[0]
     target = katpoint.construct_radec_target(ra=source_ra, dec=source_dec)
 
-    source_offset = numpy.zeros((requested_azel.shape[0], len(ants), 2))
-    for i, antenna in enumerate(ants):
-        # Compute relative azel
-        target_azel = numpy.degrees(
-            target.azel(numpy.median(offset_timestamps), antenna)
-        )
-        target_coord = SkyCoord(
-            az=target_azel[0] * units.deg,
-            alt=target_azel[1] * units.deg,
-            frame="altaz",
-        )
-        requested_coord = SkyCoord(
-            az=requested_azel[:, i, 0] * units.deg,
-            alt=requested_azel[:, i, 1] * units.deg,
-            frame="altaz",
-        )
-
-        dazim, delev = target_coord.spherical_offsets_to(requested_coord)
-        dazim = dazim.deg
-        delev = delev.deg
+    # Compute relative azel. katpoint computes the target azel one
+    # antenna at a time, but the spherical offsets for all antennas
+    # and timestamps are computed in a single broadcast call
+    timestamp = numpy.median(offset_timestamps)
+    target_azel = numpy.degrees(
+        numpy.array([target.azel(timestamp, antenna) for antenna in ants])
+    )
+    target_coord = SkyCoord(
+        az=target_azel[:, 0] * units.deg,
+        alt=target_azel[:, 1] * units.deg,
+        frame="altaz",
+    )
+    requested_coord = SkyCoord(
+        az=requested_azel[:, :, 0] * units.deg,
+        alt=requested_azel[:, :, 1] * units.deg,
+        frame="altaz",
+    )
 
-        relative_azel = numpy.column_stack((dazim, delev))
-        source_offset[:, i] = relative_azel
+    dazim, delev = target_coord.spherical_offsets_to(requested_coord)
+    source_offset = numpy.stack((dazim.deg, delev.deg), axis=-1)
 
     # Align source_offset and visibility timestamps
     source_offset = interp_timestamps(
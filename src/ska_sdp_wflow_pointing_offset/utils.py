@@ -1,20 +1,26 @@
 """
 Util functions for constructing katpoint antenna information
 """
+from functools import lru_cache
+
+import numpy
 from katpoint import Antenna
 from ska_sdp_func_python.util.coordinate_support import ecef_to_lla
 
 
-def construct_antennas(xyz, diameter, station):
+@lru_cache(maxsize=16)
+def _construct_antennas_cached(xyz, diameter, station):
     """
-    Construct list of katpoint antenna objects
-    based on telescope configuration information.
+    Cached builder for construct_antennas. Takes hashable tuples so
+    repeated calls with the same telescope configuration (common when
+    processing many scans) reuse the parsed katpoint antennas.
 
-    :param xyz: xyz coordinates of antenna positions in [nants, 3]
-    :param diameter: Diameter of dishes in [nants]
-    :param station: List of the antenna names [nants]
-    :return: a set of katpoint.Antenna objects
+    :param xyz: xyz coordinates of antenna positions as nested tuples
+    :param diameter: Diameter of dishes as a tuple
+    :param station: The antenna names as a tuple
+    :return: a tuple of katpoint.Antenna objects
     """
+    xyz = numpy.array(xyz)
     latitude, longitude, altitude = ecef_to_lla(
         x=xyz[:, 0], y=xyz[:, 1], z=xyz[:, 2]
     )
@@ -40,4 +46,23 @@ def construct_antennas(xyz, diameter, station):
         )
         ants.append(ant)
 
-    return ants
+    return tuple(ants)
+
+
+def construct_antennas(xyz, diameter, station):
+    """
+    Construct list of katpoint antenna objects
+    based on telescope configuration information.
+
+    :param xyz: xyz coordinates of antenna positions in [nants, 3]
+    :param diameter: Diameter of dishes in [nants]
+    :param station: List of the antenna names [nants]
+    :return: a set of katpoint.Antenna objects
+    """
+    return list(
+        _construct_antennas_cached(
+            tuple(map(tuple, numpy.asarray(xyz).tolist())),
+            tuple(numpy.asarray(diameter).tolist()),
+            tuple(station),
+        )
+    )
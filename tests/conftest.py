@@ -1,4 +1,13 @@
-""" Pytest fixtures """
+""" Pytest fixtures
+
+All fixtures here are pure data with no teardown, so they are safe to
+cache for the whole session. Any future fixture that holds state
+needing cleanup (file handles, clients, pools) should use the
+generator pattern (yield the object, then dispose of it) instead of
+returning it directly.
+"""
+import pickle
+
 import numpy
 import pytest
 from ska_sdp_datamodels.configuration.config_model import Configuration
@@ -17,6 +26,9 @@ from tests.utils import (
     INTEGRATION_TIME,
     LOCATION,
     MOUNT,
+    MockPointingTable,
+    MockSourceTable,
+    MockSpectralWindowTable,
     NAME,
     OFFSET,
     PHASECENTRE,
@@ -31,52 +43,54 @@ from tests.utils import (
     VIS,
     VIS_TIMESTAMPS,
     VIS_WEIGHTS,
-    WEIGHTS_PER_SCAN,
-    X_PER_SCAN,
     XYZ,
-    Y_PER_SCAN_GAINS,
-    Y_PER_SCAN_VIS,
 )
 
 NANTS = 3
 NSCANS = 5
 
 
-@pytest.fixture(name="configuration")
+@pytest.fixture(scope="session", name="configuration")
 def configuration_fixture():
     """Configuration fixture"""
     return Configuration.constructor(
         name="SKAMID",
         location=LOCATION,
-        names=numpy.array(NAME),
+        names=numpy.asarray(NAME),
         xyz=XYZ,
         mount=MOUNT,
         frame="ITRF",
         receptor_frame=ReceptorFrame("linear"),
         diameter=DIAMETER,
         offset=OFFSET,
-        stations=numpy.array(STATION),
+        stations=numpy.asarray(STATION),
     )
 
 
-@pytest.fixture(name="ants")
+@pytest.fixture(scope="session", name="ants")
 def ants_fixture():
     """Antennas fixture"""
     return construct_antennas(XYZ, DIAMETER, STATION)
 
 
-@pytest.fixture(name="source_offset")
-def source_offset_fixture():
-    """Source offset fixture"""
-    source_offset_list = []
-    for _ in range(NSCANS):
-        source_offset_list.append(
-            numpy.dstack((SOURCE_OFFSET_AZ, SOURCE_OFFSET_EL))
-        )
-    return source_offset_list
+@pytest.fixture(scope="session", name="source_offset_batched")
+def source_offset_batched_fixture():
+    """
+    Source offsets for all scans as one contiguous read-only array
+    in [NSCANS, ntimes, nants, 2]. The scans are identical, so a
+    broadcast view avoids materialising NSCANS copies
+    """
+    base = numpy.stack((SOURCE_OFFSET_AZ, SOURCE_OFFSET_EL), axis=-1)
+    return numpy.broadcast_to(base, (NSCANS,) + base.shape)
 
 
-@pytest.fixture(name="offset_timestamps")
+@pytest.fixture(scope="session", name="source_offset")
+def source_offset_fixture(source_offset_batched):
+    """Source offset fixture (per-scan views of the batched array)"""
+    return list(source_offset_batched)
+
+
+@pytest.fixture(scope="session", name="offset_timestamps")
 def source_offset_timestamps_fixture():
     """Source offset timestamps fixture"""
     offset_timestamps_list = []
@@ -85,62 +99,48 @@ def source_offset_timestamps_fixture():
     return offset_timestamps_list
 
 
-@pytest.fixture(name="target")
+@pytest.fixture(scope="session", name="target")
 def katpoint_target_fixture():
     """katpoint target fixture"""
     return TARGET
 
 
-@pytest.fixture(name="vis_array")
+@pytest.fixture(scope="session", name="mock_ms_tables")
+def mock_ms_tables_fixture():
+    """
+    Mock measurement set sub-tables in the order returned by
+    _load_ms_tables. The mocks are stateless dict lookups, so one
+    set of instances is shared for the whole session
+    """
+    return (
+        MockSpectralWindowTable(),
+        MockPointingTable(),
+        MockSourceTable(),
+    )
+
+
+@pytest.fixture(scope="session", name="vis_array")
 def vis_array_fixture(configuration):
     """Visibility fixture"""
-    vis_list = []
-    for _ in range(NSCANS):
-        vis = Visibility.constructor(
-            frequency=FREQS,
-            channel_bandwidth=CHANNEL_BANDWIDTH,
-            phasecentre=PHASECENTRE,
-            configuration=configuration,
-            uvw=UVW,
-            time=VIS_TIMESTAMPS,
-            vis=VIS,
-            weight=VIS_WEIGHTS,
-            integration_time=INTEGRATION_TIME,
-            flags=FLAGS,
-            baselines=BASELINES,
-            polarisation_frame=POLARISATION_FRAME,
-            source=SOURCE,
-            meta={"MSV2": {"FIELD_ID": 0, "DATA_DESC_ID": 0}},
-        )
-        vis_list.append(vis)
-    return vis_list
-
-
-@pytest.fixture(name="frequency")
-def freqs_fixture():
-    """The frequencies of observation fixture"""
-    return FREQS
-
-
-@pytest.fixture(name="x_per_scan")
-def x_per_scan_fixture():
-    """The antenna positions per scan fixture"""
-    return X_PER_SCAN
-
-
-@pytest.fixture(name="y_per_scan_vis")
-def y_per_scan_vis_fixture():
-    """The visibility amplitudes of all antennas for each scan fixture"""
-    return Y_PER_SCAN_VIS
-
-
-@pytest.fixture(name="y_per_scan_gains")
-def y_per_scan_gains_fixture():
-    """The gain amplitudes of all antennas for each scan fixture"""
-    return Y_PER_SCAN_GAINS
-
-
-@pytest.fixture(name="weights_per_scan")
-def weights_per_scan_fixture():
-    """The weights of all antennas for each scan fixture"""
-    return WEIGHTS_PER_SCAN
+    template = Visibility.constructor(
+        frequency=FREQS,
+        channel_bandwidth=CHANNEL_BANDWIDTH,
+        phasecentre=PHASECENTRE,
+        configuration=configuration,
+        uvw=UVW,
+        time=VIS_TIMESTAMPS,
+        vis=VIS,
+        weight=VIS_WEIGHTS,
+        integration_time=INTEGRATION_TIME,
+        flags=FLAGS,
+        baselines=BASELINES,
+        polarisation_frame=POLARISATION_FRAME,
+        source=SOURCE,
+        meta={"MSV2": {"FIELD_ID": 0, "DATA_DESC_ID": 0}},
+    )
+
+    # The scans are identical, so run the constructor once and take
+    # fast independent deep copies via a pickle round-trip instead of
+    # re-validating the dataset NSCANS times
+    blob = pickle.dumps(template, protocol=5)
+    return [template] + [pickle.loads(blob) for _ in range(NSCANS - 1)]
@@ -1,9 +1,11 @@
 """
 Unit tests for frequency selection functions
 """
+import contextlib
 from unittest.mock import patch
 
 import numpy
+import pytest
 
 from ska_sdp_wflow_pointing_offset.array_data_func import (
     apply_rfi_mask,
@@ -19,35 +21,34 @@ from tests.utils import (
 )
 
 NCHAN = 5
+NSCANS = 5
 FREQS = numpy.linspace(1.0e8, 3.0e8, NCHAN)
 
 
-@patch("numpy.loadtxt")
-def test_apply_rfi_mask(mock_load):
-    """
-    Unit test for apply_rfi_mask
-    Assume same length for RFI mask and visibility frequency
-    """
-    mock_load.return_value = numpy.array([1, 1, 0, 1, 1])
-    result_freqs, result_channels = apply_rfi_mask(
-        FREQS, rfi_filename="fake_file"
-    )
-
-    assert result_freqs == numpy.array([2.0e8])
-    assert result_channels == numpy.array([2])
-
-
-def test_apply_rfi_mask_wrong_file():
+@pytest.mark.parametrize(
+    "rfi_mask, expected_freqs, expected_channels",
+    [
+        # Same length assumed for RFI mask and visibility frequency
+        (numpy.array([1, 1, 0, 1, 1]), numpy.array([2.0e8]), numpy.array([2])),
+        # Wrong file name provided: no flags applied
+        (None, FREQS, numpy.arange(NCHAN)),
+    ],
+    ids=["mask_applied", "wrong_file"],
+)
+def test_apply_rfi_mask(rfi_mask, expected_freqs, expected_channels):
     """
     Unit test for apply_rfi_mask
-    If wrong file name is provided
     """
-    result_freqs, result_channels = apply_rfi_mask(
-        FREQS, rfi_filename="fake_file"
-    )
+    with contextlib.ExitStack() as stack:
+        if rfi_mask is not None:
+            mock_load = stack.enter_context(patch("numpy.loadtxt"))
+            mock_load.return_value = rfi_mask
+        result_freqs, result_channels = apply_rfi_mask(
+            FREQS, rfi_filename="fake_file"
+        )
 
-    assert (result_freqs == FREQS).all()
-    assert (result_channels == numpy.array(range(NCHAN))).all()
+    assert numpy.array_equal(result_freqs, expected_freqs)
+    assert numpy.array_equal(result_channels, expected_channels)
 
 
 def test_select_channels():
@@ -56,17 +57,17 @@ def test_select_channels():
     """
 
     result_freqs, result_channels = select_channels(
-        FREQS, numpy.array(range(NCHAN)), 1.8e8, 2.8e8
+        FREQS, numpy.arange(NCHAN), 1.8e8, 2.8e8
     )
-    assert result_freqs.all() == numpy.array([2.0e8, 2.5e8]).all()
-    assert result_channels.all() == numpy.array([2, 3]).all()
+    assert numpy.array_equal(result_freqs, numpy.array([2.0e8, 2.5e8]))
+    assert numpy.array_equal(result_channels, numpy.array([2, 3]))
 
 
 def test_interp_timestamps():
     """
     Unit test for interp_timestamps
     """
-    offset = numpy.dstack([SOURCE_OFFSET_AZ, SOURCE_OFFSET_EL])
+    offset = numpy.stack((SOURCE_OFFSET_AZ, SOURCE_OFFSET_EL), axis=-1)
     out = interp_timestamps(offset, POINTING_TIMESTAMPS, VIS_TIMESTAMPS)
     assert out.shape == (5, 3, 2)
 
@@ -79,9 +80,9 @@ def test_compute_gains(vis_array):
     """
     Unit test for compute_gains
     """
-    gt_list = []
-    for vis in vis_array:
-        gt_list.append(compute_gains(vis, 1))
+    gt_array = numpy.empty(NSCANS, dtype=object)
+    for i, vis in enumerate(vis_array):
+        gt_array[i] = compute_gains(vis, 1)
 
-    assert len(gt_list) == 5
-    assert gt_list[0][0]["gain"].data.shape == (5, 3, 1, 2, 2)
+    assert len(gt_array) == 5
+    assert gt_array[0][0]["gain"].data.shape == (5, 3, 1, 2, 2)
@@ -2,6 +2,7 @@
 Unit tests for beam fitting functions
 """
 import numpy
+import pytest
 
 from ska_sdp_wflow_pointing_offset.array_data_func import weighted_average
 from ska_sdp_wflow_pointing_offset.beam_fitting import (
@@ -9,7 +10,56 @@ from ska_sdp_wflow_pointing_offset.beam_fitting import (
     _fwhm_to_sigma,
     _sigma_to_fwhm,
 )
-from tests.utils import BEAMWIDTH_FACTOR, THRESH_WIDTH
+from tests.utils import (
+    ANTS,
+    BEAMWIDTH_FACTOR,
+    FREQS,
+    THRESH_WIDTH,
+    WEIGHTS_PER_SCAN,
+    X_PER_SCAN,
+    Y_PER_SCAN_GAINS,
+    Y_PER_SCAN_VIS,
+)
+
+# Mean frequency for the expected-beamwidth calculation, computed once
+# at import rather than inside each fixture
+MEAN_FREQ = numpy.mean(FREQS)
+
+
+@pytest.fixture(scope="module", name="vis_offset")
+def vis_offset_fixture():
+    """
+    The weighted-average offsets from fitting primary beams to the
+    visibility amplitudes. Module-scoped so the expensive fit runs
+    once for all assertions
+    """
+    fitted_beams = SolveForOffsets(
+        X_PER_SCAN,
+        Y_PER_SCAN_VIS,
+        MEAN_FREQ,
+        BEAMWIDTH_FACTOR,
+        ANTS,
+        THRESH_WIDTH,
+    ).fit_to_visibilities()
+    return weighted_average(ANTS, fitted_beams)
+
+
+@pytest.fixture(scope="module", name="gain_offset")
+def gain_offset_fixture():
+    """
+    The weighted-average offsets from fitting primary beams to the
+    gain amplitudes. Module-scoped so the expensive fit runs once
+    for all assertions
+    """
+    fitted_beams = SolveForOffsets(
+        X_PER_SCAN,
+        Y_PER_SCAN_GAINS,
+        MEAN_FREQ,
+        BEAMWIDTH_FACTOR,
+        ANTS,
+        THRESH_WIDTH,
+    ).fit_to_gains(WEIGHTS_PER_SCAN)
+    return weighted_average(ANTS, fitted_beams)
 
 
 def test_fwhm_to_sigma():
@@ -28,47 +78,24 @@ def test_sigma_to_fwhm():
     assert _sigma_to_fwhm(sigma) == 0.023548200450309493
 
 
-def test_fit_to_visibilities(y_per_scan_vis, x_per_scan, frequency, ants):
+@pytest.mark.parametrize("col", [0, 1], ids=["azimuth", "elevation"])
+def test_fit_to_visibilities(vis_offset, col):
     """
     Unit test for fitting primary beams to visibility amplitudes
     """
-    fitted_beams = SolveForOffsets(
-        x_per_scan,
-        y_per_scan_vis,
-        numpy.mean(frequency),
-        BEAMWIDTH_FACTOR,
-        ants,
-        THRESH_WIDTH,
-    ).fit_to_visibilities()
-    azel_offset = weighted_average(ants, fitted_beams)
-    assert (numpy.isnan(azel_offset[:, 0])).all()
-    assert (numpy.isnan(azel_offset[:, 1])).all()
+    assert (numpy.isnan(vis_offset[:, col])).all()
 
 
-def test_fit_to_gain(
-    y_per_scan_gains, x_per_scan, frequency, ants, weights_per_scan
-):
+@pytest.mark.parametrize(
+    "col, expected",
+    [
+        (0, numpy.array([-0.000212, -0.000427, -0.00037])),
+        (1, numpy.array([-0.000173, -0.000235, -0.000222])),
+    ],
+    ids=["azimuth", "elevation"],
+)
+def test_fit_to_gain(gain_offset, col, expected):
     """
     Unit test for fitting primary beams to gain amplitudes
     """
-    fitted_beams = SolveForOffsets(
-        x_per_scan,
-        y_per_scan_gains,
-        numpy.mean(frequency),
-        BEAMWIDTH_FACTOR,
-        ants,
-        THRESH_WIDTH,
-    ).fit_to_gains(weights_per_scan)
-
-    # Check the fitted AzEl offsets
-    azel_offset = weighted_average(ants, fitted_beams)
-    numpy.testing.assert_almost_equal(
-        azel_offset[:, 0],
-        numpy.array([-0.000212, -0.000427, -0.00037]),
-        decimal=6,
-    )
-    numpy.testing.assert_almost_equal(
-        azel_offset[:, 1],
-        numpy.array([-0.000173, -0.000235, -0.000222]),
-        decimal=6,
-    )
+    numpy.testing.assert_almost_equal(gain_offset[:, col], expected, decimal=6)
@@ -2,9 +2,6 @@
 Unit Tests to create GainTable
 from CASA Tables
 """
-import os
-import tempfile
-
 import numpy
 
 from ska_sdp_wflow_pointing_offset.export_data import (
@@ -12,12 +9,11 @@ from ska_sdp_wflow_pointing_offset.export_data import (
 )
 
 
-def test_export_pointing_data_file():
+def test_export_pointing_data_file(tmp_path):
     """
     Unit test for exporting the fitted parameters to text file
     """
     offset = numpy.array([[148.95, 35.62], [999.99, 99.99]])
-    with tempfile.TemporaryDirectory() as temp_dir:
-        filename = f"{temp_dir}/test_offset.csv"
-        export_pointing_offset_data(filename, offset)
-        assert os.path.exists(filename)
+    filename = tmp_path / "test_offset.csv"
+    export_pointing_offset_data(str(filename), offset)
+    assert filename.exists()
@@ -8,13 +8,7 @@ import numpy
 import pytest
 
 from ska_sdp_wflow_pointing_offset.read_data import read_batch_visibilities
-from tests.utils import (
-    CORR_TYPE,
-    FREQS,
-    MockPointingTable,
-    MockSourceTable,
-    MockSpectralWindowTable,
-)
+from tests.utils import CORR_TYPE, FREQS
 
 casacore = pytest.importorskip("casacore")
 
@@ -22,16 +16,14 @@ casacore = pytest.importorskip("casacore")
 @patch("ska_sdp_wflow_pointing_offset.read_data.create_visibility_from_ms")
 @patch("ska_sdp_wflow_pointing_offset.read_data._load_ms_tables")
 @patch("glob.glob", return_value=["fake_ms"])
-def test_read_batch_visibilities(mock_dir, mock_tables, mock_ms, vis_array):
+def test_read_batch_visibilities(
+    mock_dir, mock_tables, mock_ms, vis_array, mock_ms_tables
+):
     """
     Unit test for read_visibilities function
     """
     mock_dir.return_value = ["fake_ms"]
-    mock_tables.return_value = (
-        MockSpectralWindowTable(),
-        MockPointingTable(),
-        MockSourceTable(),
-    )
+    mock_tables.return_value = mock_ms_tables
     mock_ms.return_value = vis_array
     (
         vis,
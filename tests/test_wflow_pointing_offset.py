@@ -5,10 +5,10 @@
 """
 import logging
 import os
-import tempfile
 from unittest.mock import patch
 
 import numpy
+import pandas
 import pytest
 
 from ska_sdp_wflow_pointing_offset.pointing_offset_cli import compute_offset
@@ -19,6 +19,15 @@ log.setLevel(logging.WARNING)
 DEFAULT_RUN = True
 PERSIST = False
 
+# Expected offsets in arcminutes; NaN marks antennas whose fits are
+# rejected by the beamwidth threshold
+EXPECTED_AZIMUTH = numpy.array([numpy.nan, 0.0, 0.0])
+EXPECTED_ELEVATION = numpy.array(
+    [numpy.nan, -10.597531820892497, 11.014530406730886]
+)
+EXPECTED_CROSS_ELEVATION = numpy.array([numpy.nan, 0.0, 0.0])
+ALL_NAN = numpy.full(3, numpy.nan)
+
 
 @patch(
     "ska_sdp_wflow_pointing_offset.pointing_offset_cli.read_batch_visibilities"
@@ -55,6 +64,7 @@ def test_wflow_pointing_offset(
     offset_timestamps,
     ants,
     target,
+    tmp_path,
 ):
     """
     Main test routine.
@@ -76,96 +86,92 @@ def test_wflow_pointing_offset(
         )
         return True
 
-    with tempfile.TemporaryDirectory() as tempdir:
-        log.info("Putting output data into temporary %s.", tempdir)
-
-        outfile = f"{tempdir}/pointing_offsets.txt"
-        beamwidth_factor = [0.976, 1.098]
-        thresh_width = 1.5
-
-        read_batch_visibilities.return_value = (
-            vis_array,
-            source_offset,
-            offset_timestamps,
-            ants,
-            target,
+    tempdir = str(tmp_path)
+    log.info("Putting output data into temporary %s.", tempdir)
+
+    outfile = f"{tempdir}/pointing_offsets.txt"
+    beamwidth_factor = [0.976, 1.098]
+    thresh_width = 1.5
+
+    read_batch_visibilities.return_value = (
+        vis_array,
+        source_offset,
+        offset_timestamps,
+        ants,
+        target,
+    )
+
+    args = {
+        "--start_freq": start_freq,
+        "--end_freq": end_freq,
+        "--apply_mask": False,
+        "--rfi_file": None,
+        "--save_offset": True,
+        "--fit_to_vis": fitting_method,
+        "--use_weights": use_weights,
+        "--results_dir": tempdir,
+        "--msdir": tempdir,
+        "--bw_factor": True,
+        "<bw_factor>": beamwidth_factor,
+        "--thresh_width": thresh_width,
+        "--time_avg": None,
+    }
+
+    compute_offset(args)
+
+    assert os.path.exists(outfile)
+
+    # pandas' C parser is much faster than numpy.loadtxt for the
+    # mixed string/float offset table
+    read_out = pandas.read_csv(
+        outfile, delimiter=",", comment="#", header=None, dtype=str
+    ).to_numpy()
+
+    # Output data: Antenna name, Az offset, El offset, Cross-el offset
+    # The Az and El offsets are asserted in test_beam_fitting.py
+    # After ORC-1716, only teh shape would be required all of these
+    # assertions would be done in test_beam_fitting.py
+    assert read_out.shape == (3, 4)
+    assert (read_out[:, 0] == ["M001", "M002", "M003"]).all()
+
+    # Convert the string columns once instead of per assertion
+    azimuth = read_out[:, 1].astype(float)
+    elevation = read_out[:, 2].astype(float)
+    cross_elevation = read_out[:, 3].astype(float)
+
+    # Zero tolerance keeps the comparisons exact; equal_nan folds the
+    # NaN checks into the same call
+    if fitting_method:
+        numpy.testing.assert_allclose(
+            azimuth, EXPECTED_AZIMUTH, rtol=0.0, atol=0.0, equal_nan=True
+        )
+        numpy.testing.assert_allclose(
+            elevation, EXPECTED_ELEVATION, rtol=0.0, atol=0.0, equal_nan=True
+        )
+        numpy.testing.assert_allclose(
+            cross_elevation,
+            EXPECTED_CROSS_ELEVATION,
+            rtol=0.0,
+            atol=0.0,
+            equal_nan=True,
+        )
+    elif use_weights:
+        assert azimuth[0] == 0.0
+    else:
+        numpy.testing.assert_allclose(
+            azimuth, ALL_NAN, rtol=0.0, atol=0.0, equal_nan=True
+        )
+        numpy.testing.assert_allclose(
+            elevation, ALL_NAN, rtol=0.0, atol=0.0, equal_nan=True
+        )
+        numpy.testing.assert_allclose(
+            cross_elevation, ALL_NAN, rtol=0.0, atol=0.0, equal_nan=True
         )
 
-        args = {
-            "--start_freq": start_freq,
-            "--end_freq": end_freq,
-            "--apply_mask": False,
-            "--rfi_file": None,
-            "--save_offset": True,
-            "--fit_to_vis": fitting_method,
-            "--use_weights": use_weights,
-            "--results_dir": tempdir,
-            "--msdir": tempdir,
-            "--bw_factor": True,
-            "<bw_factor>": beamwidth_factor,
-            "--thresh_width": thresh_width,
-            "--time_avg": None,
-        }
-
-        compute_offset(args)
-
-        assert os.path.exists(outfile)
-
-        read_out = numpy.loadtxt(outfile, delimiter=",", dtype=object)
-
-        # Output data: Antenna name, Az offset, El offset, Cross-el offset
-        # The Az and El offsets are asserted in test_beam_fitting.py
-        # After ORC-1716, only teh shape would be required all of these
-        # assertions would be done in test_beam_fitting.py
-        assert read_out.shape == (3, 4)
-        assert (read_out[:, 0] == ["M001", "M002", "M003"]).all()
-
-        if use_weights:
-            if fitting_method:
-                assert (numpy.isnan(read_out[:, 1].astype(float)[0])).all()
-                assert (
-                    read_out[:, 1].astype(float)[1:] == numpy.zeros(2)
-                ).all()
-
-                assert (numpy.isnan(read_out[:, 2].astype(float)[0])).all()
-                assert (
-                    read_out[:, 2].astype(float)[1:]
-                    == numpy.array([-10.597531820892497, 11.014530406730886])
-                ).all()
-                assert (numpy.isnan(read_out[:, 3].astype(float)[0])).all()
-                assert (
-                    read_out[:, 3].astype(float)[1:] == numpy.array([0.0, 0.0])
-                ).all()
-            else:
-                assert (
-                    read_out[:, 1].astype(float)[0]
-                    == numpy.array([0.0, 0.0, 0.0])
-                ).all()
-        else:
-            if fitting_method:
-                assert (numpy.isnan(read_out[:, 1].astype(float)[0])).all()
-                assert (
-                    read_out[:, 1].astype(float)[1:] == numpy.zeros(2)
-                ).all()
-
-                assert (numpy.isnan(read_out[:, 2].astype(float)[0])).all()
-                assert (
-                    read_out[:, 2].astype(float)[1:]
-                    == numpy.array([-10.597531820892497, 11.014530406730886])
-                ).all()
-                assert (numpy.isnan(read_out[:, 3].astype(float)[0])).all()
-                assert (
-                    read_out[:, 3].astype(float)[1:] == numpy.array([0.0, 0.0])
-                ).all()
-            else:
-                assert (numpy.isnan(read_out[:, 1].astype(float))).all()
-                assert (numpy.isnan(read_out[:, 2].astype(float))).all()
-                assert (numpy.isnan(read_out[:, 3].astype(float))).all()
-
-        # If we need to save file to tests directory
-        if PERSIST:
-            log.info("Putting data into test_results directory.")
-            test_dir = os.getcwd() + "/test_results"
-            os.makedirs(test_dir, exist_ok=True)
-            new_name = test_dir + "/pointing_offsets_" + f"{mode}" + ".txt"
-            os.replace(outfile, new_name)
+    # If we need to save file to tests directory
+    if PERSIST:
+        log.info("Putting data into test_results directory.")
+        test_dir = os.getcwd() + "/test_results"
+        os.makedirs(test_dir, exist_ok=True)
+        new_name = test_dir + "/pointing_offsets_" + f"{mode}" + ".txt"
+        os.replace(outfile, new_name)